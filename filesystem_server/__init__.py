@@ -0,0 +1 @@
+"""Standalone filesystem MCP server."""
@@ -0,0 +1,1012 @@
+"""Filesystem MCP server.
+
+Exposes file and directory manipulation tools over the MCP stdio
+transport: reading, writing, listing, searching and basic management
+of files inside the directories the server is pointed at.
+"""
+
+import asyncio
+import concurrent.futures
+import errno
+import fnmatch
+import functools
+import io
+import json
+import mmap
+import os
+import re
+import shutil
+import stat as stat_module
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Iterator
+
+import mcp.types as types
+from mcp.server import Server
+from mcp.server.stdio import stdio_server
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+# Files larger than this are read truncated so a single tool call cannot
+# pin tens of megabytes in memory (and in the model context).
+_MAX_READ_BYTES = 8 * 1024 * 1024
+
+
+def _read_bounded(path: Path, limit: int) -> str:
+    """Read at most ``limit`` bytes of ``path`` and decode leniently."""
+    with open(path, "rb") as f:
+        data = f.read(limit)
+    return data.decode("utf-8", errors="replace")
+
+
+def _fmt_mtime(ts: float) -> str:
+    """Format a timestamp as YYYY-MM-DD HH:MM:SS without datetime/strftime.
+
+    datetime.fromtimestamp + strftime dominate CPU when formatting tens
+    of thousands of directory entries; plain f-string formatting of the
+    localtime fields is several times cheaper.
+    """
+    tm = time.localtime(ts)
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d} "
+        f"{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+    )
+
+
+def _copy_file_fast(source: Path, destination: Path) -> None:
+    """Copy a regular file, preferring the kernel-side copy path.
+
+    os.copy_file_range keeps the bytes inside the kernel (reflinks on
+    btrfs/XFS, server-side copy on NFSv4.2). Falls back to shutil.copy2
+    where the syscall is missing or the filesystems don't support it.
+    """
+    if not hasattr(os, "copy_file_range"):
+        shutil.copy2(source, destination)
+        return
+    try:
+        src_fd = os.open(source, os.O_RDONLY)
+        try:
+            dst_fd = os.open(
+                destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644
+            )
+            try:
+                remaining = os.fstat(src_fd).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP):
+            raise
+        shutil.copy2(source, destination)
+        return
+    shutil.copystat(source, destination)
+
+
+def _collect_tree(
+    root: str, follow_symlinks: bool = True
+) -> tuple[list[str], list[str]]:
+    """Return (directories, files) under ``root``, parents before children.
+
+    With ``follow_symlinks`` directory symlinks are descended into,
+    matching the shutil.copytree default this walk replaced; a directory
+    seen twice means a symlink cycle and raises ELOOP rather than
+    looping forever. The delete walk passes False so directory symlinks
+    land in the file list and are unlinked in place, as shutil.rmtree
+    would, instead of having their targets emptied.
+    """
+    dirs: list[str] = []
+    files: list[str] = []
+    stack: deque[str] = deque([root])
+    seen: set[tuple[int, int]] = set()
+    while stack:
+        path = stack.pop()
+        if follow_symlinks:
+            st = os.stat(path)
+            key = (st.st_dev, st.st_ino)
+            if key in seen:
+                raise OSError(errno.ELOOP, "symlink cycle detected", path)
+            seen.add(key)
+        dirs.append(path)
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=follow_symlinks):
+                    stack.append(entry.path)
+                else:
+                    files.append(entry.path)
+    return dirs, files
+
+
+def _append_text(path: Path, content: str) -> None:
+    """Append ``content`` to ``path``, creating the file if needed."""
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(content)
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve(path: str) -> Path:
+    """Resolve a user path once; clients hammer the same roots repeatedly.
+
+    resolve() walks every component with lstat to chase symlinks, which
+    is pure overhead when the same directory is passed on call after
+    call. Symlink retargeting between calls won't be picked up until the
+    entry ages out, an accepted trade for tool-facing paths.
+    """
+    return Path(path).resolve()
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> "re.Pattern[str]":
+    """Translate a wildcard pattern to a compiled regex, cached per pattern."""
+    return re.compile(fnmatch.translate(pattern))
+
+
+def _walk_match(root: str, pattern: str, recursive: bool) -> Iterator[os.DirEntry]:
+    """Yield DirEntry objects under ``root`` whose names match ``pattern``.
+
+    A scandir-based walk with the wildcard pattern compiled once; the
+    yielded entries carry cached stat/type info, so callers never need to
+    re-stat a match. Like glob, hidden entries are skipped unless the
+    pattern itself starts with a dot.
+    """
+    match = _compile_pattern(pattern).match
+    match_hidden = pattern.startswith(".")
+    stack: deque[str] = deque([root])
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except (PermissionError, FileNotFoundError):
+            continue
+        for entry in entries:
+            if entry.name.startswith(".") and not match_hidden:
+                continue
+            if match(entry.name):
+                yield entry
+            if recursive and entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+
+
+def _scan_blocking(path: Path, pattern: "re.Pattern[bytes]") -> list[str] | None:
+    """Scan ``path`` and return its formatted matches, or None if unreadable.
+
+    The file is mmapped and searched as raw bytes, so the page cache is
+    read in place with no read_text copy and no decoding for files that
+    never match. Line text is decoded only around actual hits, the scan
+    stops after five reported lines, and remaining occurrences are just
+    counted.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        if os.fstat(fd).st_size == 0:
+            return []
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            if b"\x00" in mm[:4096]:
+                return None  # binary file
+            file_matches: list[str] = []
+            line_num = 1
+            scanned_to = 0
+            pos = 0
+            while len(file_matches) < 5:
+                m = pattern.search(mm, pos)
+                if m is None:
+                    return file_matches
+                line_start = mm.rfind(b"\n", 0, m.start()) + 1
+                line_end = mm.find(b"\n", m.end())
+                if line_end < 0:
+                    line_end = len(mm)
+                line_num += mm[scanned_to : m.start()].count(b"\n")
+                scanned_to = m.start()
+                line = mm[line_start:line_end].decode("utf-8", errors="replace")
+                file_matches.append(f"  {line_num}: {line.strip()}")
+                # Resume after this line so one line is reported at most once.
+                pos = line_end + 1
+            extra = sum(1 for _ in pattern.finditer(mm, pos))
+            if extra:
+                file_matches.append(f"  ... and {extra} more occurrences")
+            return file_matches
+    except (OSError, ValueError):
+        return None
+    finally:
+        os.close(fd)
+
+
+# Tool definitions are static; build them once at import instead of on
+# every tools/list RPC.
+_TOOLS: list[types.Tool] = [
+    types.Tool(
+        name="read_file",
+        description="Read the contents of a text file",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the file to read",
+                },
+            },
+            "required": ["file_path"],
+        },
+    ),
+    types.Tool(
+        name="write_file",
+        description="Write content to a file, replacing anything already there",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the file to write",
+                },
+                "content": {
+                    "type": "string",
+                    "description": "Content to write",
+                },
+            },
+            "required": ["file_path", "content"],
+        },
+    ),
+    types.Tool(
+        name="append_file",
+        description="Append content to the end of a file",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the file to append to",
+                },
+                "content": {
+                    "type": "string",
+                    "description": "Content to append",
+                },
+            },
+            "required": ["file_path", "content"],
+        },
+    ),
+    types.Tool(
+        name="create_directory",
+        description="Create a directory (including missing parents)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "directory_path": {
+                    "type": "string",
+                    "description": "Path of the directory to create",
+                },
+            },
+            "required": ["directory_path"],
+        },
+    ),
+    types.Tool(
+        name="list_directory",
+        description="List the contents of a directory",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "directory_path": {
+                    "type": "string",
+                    "description": "Path of the directory to list",
+                },
+                "recursive": {
+                    "type": "boolean",
+                    "description": "Recurse into subdirectories",
+                    "default": False,
+                },
+                "include_hidden": {
+                    "type": "boolean",
+                    "description": "Include entries starting with a dot",
+                    "default": False,
+                },
+            },
+            "required": ["directory_path"],
+        },
+    ),
+    types.Tool(
+        name="delete_file",
+        description="Delete a file or directory",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to delete",
+                },
+                "recursive": {
+                    "type": "boolean",
+                    "description": "Delete directories recursively",
+                    "default": False,
+                },
+            },
+            "required": ["file_path"],
+        },
+    ),
+    types.Tool(
+        name="move_file",
+        description="Move or rename a file or directory",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "source_path": {
+                    "type": "string",
+                    "description": "Current path",
+                },
+                "destination_path": {
+                    "type": "string",
+                    "description": "New path",
+                },
+            },
+            "required": ["source_path", "destination_path"],
+        },
+    ),
+    types.Tool(
+        name="copy_file",
+        description="Copy a file or directory",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "source_path": {
+                    "type": "string",
+                    "description": "Path to copy from",
+                },
+                "destination_path": {
+                    "type": "string",
+                    "description": "Path to copy to",
+                },
+            },
+            "required": ["source_path", "destination_path"],
+        },
+    ),
+    types.Tool(
+        name="search_files",
+        description="Search for files matching a wildcard pattern",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "directory_path": {
+                    "type": "string",
+                    "description": "Directory to search in",
+                },
+                "pattern": {
+                    "type": "string",
+                    "description": "Wildcard pattern, e.g. *.py",
+                },
+                "recursive": {
+                    "type": "boolean",
+                    "description": "Search subdirectories too",
+                    "default": True,
+                },
+            },
+            "required": ["directory_path", "pattern"],
+        },
+    ),
+    types.Tool(
+        name="find_text",
+        description="Find a text string inside files",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "directory_path": {
+                    "type": "string",
+                    "description": "Directory to search in",
+                },
+                "search_text": {
+                    "type": "string",
+                    "description": "Text to look for",
+                },
+                "file_pattern": {
+                    "type": "string",
+                    "description": "Only scan files matching this pattern",
+                    "default": "*",
+                },
+                "case_sensitive": {
+                    "type": "boolean",
+                    "description": "Match case exactly",
+                    "default": False,
+                },
+            },
+            "required": ["directory_path", "search_text"],
+        },
+    ),
+    types.Tool(
+        name="file_info",
+        description="Get detailed information about a file or directory",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to inspect",
+                },
+            },
+            "required": ["file_path"],
+        },
+    ),
+]
+
+
+class FilesystemServer:
+    """MCP server wrapping local filesystem operations."""
+
+    # LLM clients tend to re-query the same paths in quick succession;
+    # file_info responses are served from a short-lived cache.
+    _INFO_CACHE_TTL = 2.0
+    _INFO_CACHE_MAX = 512
+
+    # O(1) tool dispatch instead of an if/elif chain per call.
+    _TOOL_DISPATCH = {
+        "read_file": "_read_file",
+        "write_file": "_write_file",
+        "append_file": "_append_file",
+        "create_directory": "_create_directory",
+        "list_directory": "_list_directory",
+        "delete_file": "_delete_file",
+        "move_file": "_move_file",
+        "copy_file": "_copy_file",
+        "search_files": "_search_files",
+        "find_text": "_find_text",
+        "file_info": "_file_info",
+    }
+
+    def __init__(self) -> None:
+        self.server = Server("filesystem-server")
+        # Blocking file I/O runs here instead of on the event loop, so
+        # concurrent tool calls are not serialized behind a slow disk.
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) * 4),
+            thread_name_prefix="fs-io",
+        )
+        # Created lazily on the first sizeable find_text call; the bytes
+        # scan is CPU-bound, so processes sidestep the GIL.
+        self._cpu_pool: concurrent.futures.ProcessPoolExecutor | None = None
+        # path -> (expiry from time.monotonic, rendered response)
+        self._info_cache: dict[str, tuple[float, str]] = {}
+        # Append coalescing: contents queued per path and flushed by a
+        # single task per path after a short window, so bursts of small
+        # appends become one write instead of one open/write/close each.
+        self._append_queues: dict[Path, list[str]] = {}
+        self._append_tasks: dict[Path, asyncio.Task] = {}
+        self.setup_handlers()
+
+    async def _flush_appends(self, path: Path) -> None:
+        """Flush everything queued for ``path`` in one write."""
+        await asyncio.sleep(0.01)
+        # No awaits between the pops and the join, so late arrivals either
+        # make this batch or start a fresh queue+task of their own.
+        chunks = self._append_queues.pop(path, [])
+        self._append_tasks.pop(path, None)
+        if chunks:
+            await self._run_blocking(_append_text, path, "".join(chunks))
+
+    async def _copytree_parallel(self, source: Path, destination: Path) -> None:
+        """Copy a directory tree with file copies fanned out over the I/O pool."""
+        src = str(source)
+        dst = str(destination)
+        dirs, files = await self._run_blocking(_collect_tree, src)
+        src_len = len(src)
+        # Mirror the directory skeleton first (cheap, ordered), then copy
+        # the independent files concurrently.
+        for d in dirs:
+            os.makedirs(dst + d[src_len:], exist_ok=True)
+        semaphore = asyncio.Semaphore(32)
+
+        async def _copy_one(path: str) -> None:
+            async with semaphore:
+                await self._run_blocking(
+                    _copy_file_fast, Path(path), Path(dst + path[src_len:])
+                )
+
+        await asyncio.gather(*(_copy_one(f) for f in files))
+
+    async def _rmtree_parallel(self, root: Path) -> None:
+        """Delete a directory tree, unlinking files concurrently."""
+        dirs, files = await self._run_blocking(_collect_tree, str(root), False)
+        semaphore = asyncio.Semaphore(32)
+
+        async def _unlink_one(path: str) -> None:
+            async with semaphore:
+                await self._run_blocking(os.unlink, path)
+
+        await asyncio.gather(*(_unlink_one(f) for f in files))
+        # Directories come out parent-first; remove them deepest-first.
+        for d in reversed(dirs):
+            os.rmdir(d)
+
+    def _invalidate_info_cache(self, *paths: Path) -> None:
+        """Drop cached info for the given paths, their ancestors and children."""
+        cache = self._info_cache
+        if not cache:
+            return
+        for path in paths:
+            changed = str(path)
+            for key in [
+                k for k in cache if k.startswith(changed) or changed.startswith(k)
+            ]:
+                del cache[key]
+
+    async def _run_blocking(self, func, *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking callable on the I/O thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._io_pool, functools.partial(func, *args, **kwargs)
+        )
+
+    def setup_handlers(self) -> None:
+        @self.server.list_tools()
+        async def handle_list_tools() -> list[types.Tool]:
+            return _TOOLS
+
+        @self.server.call_tool()
+        async def handle_call_tool(
+            name: str, arguments: dict[str, Any]
+        ) -> list[types.TextContent]:
+            method_name = self._TOOL_DISPATCH.get(name)
+            if method_name is None:
+                raise ValueError(f"Unknown tool: {name}")
+            return await getattr(self, method_name)(arguments)
+
+    async def _read_file(self, arguments: dict[str, Any]) -> list[types.TextContent]:
+        file_path = _resolve(arguments["file_path"])
+        try:
+            # Stat once; the mode check, the size cap and every message
+            # below all come from this single syscall.
+            try:
+                st = file_path.stat()
+            except (FileNotFoundError, NotADirectoryError):
+                return [
+                    types.TextContent(
+                        type="text", text=f"Error: {file_path} is not a file"
+                    )
+                ]
+            if not stat_module.S_ISREG(st.st_mode):
+                return [
+                    types.TextContent(
+                        type="text", text=f"Error: {file_path} is not a file"
+                    )
+                ]
+            if st.st_size > _MAX_READ_BYTES:
+                content = await self._run_blocking(
+                    _read_bounded, file_path, _MAX_READ_BYTES
+                )
+                header = (
+                    f"Contents of {file_path} (truncated to first "
+                    f"{_MAX_READ_BYTES} of {st.st_size} bytes):\n\n"
+                )
+            else:
+                content = await self._run_blocking(
+                    file_path.read_text, encoding="utf-8"
+                )
+                header = f"Contents of {file_path}:\n\n"
+            # join instead of an f-string so the file body is not copied
+            # a second time into the response.
+            return [types.TextContent(type="text", text="".join((header, content)))]
+        except UnicodeDecodeError:
+            return [
+                types.TextContent(
+                    type="text",
+                    text=f"Error: {file_path} is not a text file ({st.st_size} bytes)",
+                )
+            ]
+        except Exception as e:
+            return [
+                types.TextContent(type="text", text=f"Error reading file: {e}")
+            ]
+
+    async def _write_file(self, arguments: dict[str, Any]) -> list[types.TextContent]:
+        file_path = _resolve(arguments["file_path"])
+        content = arguments["content"]
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            await self._run_blocking(
+                file_path.write_text, content, encoding="utf-8"
+            )
+            self._invalidate_info_cache(file_path)
+            return [
+                types.TextContent(
+                    type="text",
+                    text=f"Wrote {len(content)} characters to {file_path}",
+                )
+            ]
+        except Exception as e:
+            return [
+                types.TextContent(type="text", text=f"Error writing file: {e}")
+            ]
+
+    async def _append_file(self, arguments: dict[str, Any]) -> list[types.TextContent]:
+        file_path = _resolve(arguments["file_path"])
+        content = arguments["content"]
+        try:
+            self._append_queues.setdefault(file_path, []).append(content)
+            task = self._append_tasks.get(file_path)
+            if task is None:
+                task = asyncio.create_task(self._flush_appends(file_path))
+                self._append_tasks[file_path] = task
+            # Await the shared flusher so errors still surface to every
+            # caller whose content rode in this batch.
+            await task
+            self._invalidate_info_cache(file_path)
+            return [
+                types.TextContent(
+                    type="text",
+                    text=f"Appended {len(content)} characters to {file_path}",
+                )
+            ]
+        except Exception as e:
+            return [
+                types.TextContent(type="text", text=f"Error appending to file: {e}")
+            ]
+
+    async def _create_directory(
+        self, arguments: dict[str, Any]
+    ) -> list[types.TextContent]:
+        directory_path = _resolve(arguments["directory_path"])
+        try:
+            directory_path.mkdir(parents=True, exist_ok=True)
+            self._invalidate_info_cache(directory_path)
+            return [
+                types.TextContent(
+                    type="text", text=f"Created directory {directory_path}"
+                )
+            ]
+        except Exception as e:
+            return [
+                types.TextContent(type="text", text=f"Error creating directory: {e}")
+            ]
+
+    async def _list_directory(
+        self, arguments: dict[str, Any]
+    ) -> list[types.TextContent]:
+        directory_path = _resolve(arguments["directory_path"])
+        recursive = arguments.get("recursive", False)
+        include_hidden = arguments.get("include_hidden", False)
+        try:
+            if not directory_path.is_dir():
+                return [
+                    types.TextContent(
+                        type="text", text=f"Error: {directory_path} is not a directory"
+                    )
+                ]
+
+            # Single growing buffer instead of a list of per-entry strings
+            # plus a join copy at the end. Each line is written with its
+            # leading newline, which doubles as the blank line after the
+            # header.
+            buf = io.StringIO()
+            _write = buf.write
+
+            # Iterative depth-first traversal: an explicit stack replaces
+            # Python-level recursion while keeping the recursive output
+            # order (a directory's children right after its own line).
+            # Stack items are ("line", text, _) or ("dir", path, depth);
+            # children are pushed in reverse name order so they pop sorted.
+            stack: deque[tuple[str, str, int]] = deque(
+                [("dir", str(directory_path), 0)]
+            )
+            while stack:
+                kind, payload, depth = stack.pop()
+                if kind == "line":
+                    _write("\n")
+                    _write(payload)
+                    continue
+                # DirEntry caches type and stat info from the getdents
+                # batch, so no extra stat syscalls per entry.
+                with os.scandir(payload) as it:
+                    entries = sorted(it, key=lambda e: e.name, reverse=True)
+                indent = "  " * depth
+                for entry in entries:
+                    if not include_hidden and entry.name.startswith("."):
+                        continue
+                    stat = entry.stat(follow_symlinks=False)
+                    modified = _fmt_mtime(stat.st_mtime)
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive and depth < 10:
+                            stack.append(("dir", entry.path, depth + 1))
+                        stack.append(
+                            ("line", f"{indent}📁 {entry.name}/ - {modified}", depth)
+                        )
+                    elif entry.is_file(follow_symlinks=False):
+                        size = self._human_readable_size(stat.st_size)
+                        stack.append(
+                            (
+                                "line",
+                                f"{indent}📄 {entry.name} ({size}) - {modified}",
+                                depth,
+                            )
+                        )
+            listing = buf.getvalue() or "\n(empty)"
+            return [
+                types.TextContent(
+                    type="text", text=f"Directory: {directory_path}\n{listing}"
+                )
+            ]
+        except Exception as e:
+            return [
+                types.TextContent(type="text", text=f"Error listing directory: {e}")
+            ]
+
+    async def _delete_file(self, arguments: dict[str, Any]) -> list[types.TextContent]:
+        file_path = _resolve(arguments["file_path"])
+        recursive = arguments.get("recursive", False)
+        try:
+            # One stat answers existence and the file/directory branch.
+            try:
+                st = file_path.stat()
+            except FileNotFoundError:
+                return [
+                    types.TextContent(
+                        type="text", text=f"Error: {file_path} does not exist"
+                    )
+                ]
+            if stat_module.S_ISREG(st.st_mode):
+                file_path.unlink()
+                self._invalidate_info_cache(file_path)
+                return [
+                    types.TextContent(type="text", text=f"Deleted file {file_path}")
+                ]
+            elif stat_module.S_ISDIR(st.st_mode):
+                if not recursive:
+                    return [
+                        types.TextContent(
+                            type="text",
+                            text=f"Error: {file_path} is a directory (use recursive=true)",
+                        )
+                    ]
+                await self._rmtree_parallel(file_path)
+                self._invalidate_info_cache(file_path)
+                return [
+                    types.TextContent(
+                        type="text", text=f"Deleted directory {file_path}"
+                    )
+                ]
+            return [
+                types.TextContent(
+                    type="text", text=f"Error: cannot delete {file_path}"
+                )
+            ]
+        except Exception as e:
+            return [types.TextContent(type="text", text=f"Error deleting: {e}")]
+
+    async def _move_file(self, arguments: dict[str, Any]) -> list[types.TextContent]:
+        source_path = _resolve(arguments["source_path"])
+        destination_path = _resolve(arguments["destination_path"])
+        try:
+            if not source_path.exists():
+                return [
+                    types.TextContent(
+                        type="text", text=f"Error: {source_path} does not exist"
+                    )
+                ]
+            destination_path.parent.mkdir(parents=True, exist_ok=True)
+            await self._run_blocking(
+                shutil.move, str(source_path), str(destination_path)
+            )
+            self._invalidate_info_cache(source_path, destination_path)
+            return [
+                types.TextContent(
+                    type="text", text=f"Moved {source_path} to {destination_path}"
+                )
+            ]
+        except Exception as e:
+            return [types.TextContent(type="text", text=f"Error moving: {e}")]
+
+    async def _copy_file(self, arguments: dict[str, Any]) -> list[types.TextContent]:
+        source_path = _resolve(arguments["source_path"])
+        destination_path = _resolve(arguments["destination_path"])
+        try:
+            if not source_path.exists():
+                return [
+                    types.TextContent(
+                        type="text", text=f"Error: {source_path} does not exist"
+                    )
+                ]
+            destination_path.parent.mkdir(parents=True, exist_ok=True)
+            if source_path.is_file():
+                await self._run_blocking(
+                    _copy_file_fast, source_path, destination_path
+                )
+            else:
+                await self._copytree_parallel(source_path, destination_path)
+            self._invalidate_info_cache(destination_path)
+            return [
+                types.TextContent(
+                    type="text", text=f"Copied {source_path} to {destination_path}"
+                )
+            ]
+        except Exception as e:
+            return [types.TextContent(type="text", text=f"Error copying: {e}")]
+
+    async def _search_files(
+        self, arguments: dict[str, Any]
+    ) -> list[types.TextContent]:
+        directory_path = _resolve(arguments["directory_path"])
+        pattern = arguments["pattern"]
+        recursive = arguments.get("recursive", True)
+        try:
+            if not directory_path.is_dir():
+                return [
+                    types.TextContent(
+                        type="text", text=f"Error: {directory_path} is not a directory"
+                    )
+                ]
+            entries = list(_walk_match(str(directory_path), pattern, recursive))
+            entries.sort(key=lambda e: e.path)
+
+            results: list[str] = []
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    size = self._human_readable_size(
+                        entry.stat(follow_symlinks=False).st_size
+                    )
+                    results.append(f"📄 {entry.path} ({size})")
+                elif entry.is_dir(follow_symlinks=False):
+                    results.append(f"📁 {entry.path}")
+
+            if not results:
+                text = f"No files matching '{pattern}' in {directory_path}"
+            else:
+                listing = "\n".join(results)
+                text = (
+                    f"Found {len(results)} matches for '{pattern}' "
+                    f"in {directory_path}:\n\n{listing}"
+                )
+            return [types.TextContent(type="text", text=text)]
+        except Exception as e:
+            return [types.TextContent(type="text", text=f"Error searching: {e}")]
+
+    async def _find_text(self, arguments: dict[str, Any]) -> list[types.TextContent]:
+        directory_path = _resolve(arguments["directory_path"])
+        search_text = arguments["search_text"]
+        file_pattern = arguments.get("file_pattern", "*")
+        case_sensitive = arguments.get("case_sensitive", False)
+        try:
+            if not directory_path.is_dir():
+                return [
+                    types.TextContent(
+                        type="text", text=f"Error: {directory_path} is not a directory"
+                    )
+                ]
+            # Bytes pattern so workers can search the mmap directly; note
+            # bytes IGNORECASE folds ASCII only.
+            pattern = re.compile(
+                re.escape(search_text).encode("utf-8"),
+                0 if case_sensitive else re.IGNORECASE,
+            )
+            # The walk's cached type info lets us drop non-files without
+            # any extra stat calls.
+            paths = sorted(
+                Path(entry.path)
+                for entry in _walk_match(str(directory_path), file_pattern, True)
+                if entry.is_file(follow_symlinks=False)
+            )
+
+            # Scan files concurrently; the semaphore bounds how many file
+            # descriptors are open at once. Large batches go to a process
+            # pool (the scan is CPU-bound once mmapped), tiny ones stay on
+            # the thread pool where IPC overhead would dominate.
+            semaphore = asyncio.Semaphore(32)
+            if len(paths) >= 8:
+                if self._cpu_pool is None:
+                    self._cpu_pool = concurrent.futures.ProcessPoolExecutor(
+                        max_workers=os.cpu_count()
+                    )
+                pool = self._cpu_pool
+            else:
+                pool = self._io_pool
+            loop = asyncio.get_running_loop()
+
+            async def _scan_one(fp: Path) -> list[str] | None:
+                async with semaphore:
+                    return await loop.run_in_executor(
+                        pool, _scan_blocking, fp, pattern
+                    )
+
+            results = await asyncio.gather(*(_scan_one(fp) for fp in paths))
+
+            buf = io.StringIO()
+            for fp, file_matches in zip(paths, results):
+                if file_matches:
+                    buf.write(f"\n📄 {fp}:")
+                    for line in file_matches:
+                        buf.write("\n")
+                        buf.write(line)
+
+            listing = buf.getvalue()
+            if not listing:
+                text = f"No occurrences of '{search_text}' in {directory_path}"
+            else:
+                text = (
+                    f"Occurrences of '{search_text}' in {directory_path}:\n{listing}"
+                )
+            return [types.TextContent(type="text", text=text)]
+        except Exception as e:
+            return [types.TextContent(type="text", text=f"Error searching text: {e}")]
+
+    async def _file_info(self, arguments: dict[str, Any]) -> list[types.TextContent]:
+        file_path = _resolve(arguments["file_path"])
+        cache_key = str(file_path)
+        cached = self._info_cache.get(cache_key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return [types.TextContent(type="text", text=cached[1])]
+        try:
+            # One stat; existence, type and every reported field derive
+            # from it instead of separate exists/stat/is_dir syscalls.
+            try:
+                st = file_path.stat()
+            except FileNotFoundError:
+                return [
+                    types.TextContent(
+                        type="text", text=f"Error: {file_path} does not exist"
+                    )
+                ]
+            is_dir = stat_module.S_ISDIR(st.st_mode)
+            info: dict[str, Any] = {
+                "path": str(file_path),
+                "type": "directory" if is_dir else "file",
+                "size": st.st_size,
+                "size_human": self._human_readable_size(st.st_size),
+                "modified": _fmt_mtime(st.st_mtime),
+                "created": _fmt_mtime(st.st_ctime),
+                "permissions": oct(st.st_mode)[-3:],
+            }
+            if is_dir:
+                try:
+                    info["item_count"] = sum(1 for _ in os.scandir(file_path))
+                except PermissionError:
+                    info["item_count"] = "permission denied"
+            if orjson is not None:
+                rendered = orjson.dumps(info, option=orjson.OPT_INDENT_2).decode()
+            else:
+                rendered = json.dumps(info, indent=2)
+            if len(self._info_cache) >= self._INFO_CACHE_MAX:
+                self._info_cache.clear()
+            self._info_cache[cache_key] = (
+                time.monotonic() + self._INFO_CACHE_TTL,
+                rendered,
+            )
+            return [types.TextContent(type="text", text=rendered)]
+        except Exception as e:
+            return [
+                types.TextContent(type="text", text=f"Error getting file info: {e}")
+            ]
+
+    @staticmethod
+    def _human_readable_size(size: float) -> str:
+        for unit in ("B", "KB", "MB", "GB", "TB"):
+            if size < 1024.0:
+                return f"{size:.1f} {unit}" if unit != "B" else f"{int(size)} B"
+            size /= 1024.0
+        return f"{size:.1f} PB"
+
+
+async def main() -> None:
+    fs_server = FilesystemServer()
+    async with stdio_server() as (read_stream, write_stream):
+        await fs_server.server.run(
+            read_stream,
+            write_stream,
+            fs_server.server.create_initialization_options(),
+        )
+
+
+if __name__ == "__main__":
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - optional speedup
+        uvloop = None
+    if uvloop is not None:
+        uvloop.install()
+    asyncio.run(main())
@@ -0,0 +1 @@
+"""Unified MCP server combining filesystem and Odoo tools."""
@@ -0,0 +1,29 @@
+"""Build-time helper: persist the tool definitions for cold starts.
+
+Run from the repository root:
+
+    python -m unified_server._build_schema_cache
+
+Writes ``tool_definitions.cache.json`` next to this module. At runtime
+``get_all_tools`` reconstructs the Tool list from that blob with one
+json.loads plus ``model_construct``, instead of re-running every schema
+dict construction on each cold start.
+"""
+
+import json
+from pathlib import Path
+
+from .tools import get_core_tools, get_extended_tools
+
+
+def main() -> None:
+    tools = [*get_core_tools(), *get_extended_tools()]
+    rows = [tool.model_dump() for tool in tools]
+    out = Path(__file__).with_name("tool_definitions.cache.json")
+    # default=dict unwraps the MappingProxyType schema constants.
+    out.write_text(json.dumps(rows, indent=2, default=dict))
+    print(f"Wrote {len(rows)} tool definitions to {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,796 @@
+"""Filesystem tool implementations for the unified MCP server."""
+
+import asyncio
+import concurrent.futures
+import fnmatch
+import functools
+import hashlib
+import json
+import mmap
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+from typing import Any, Iterator
+
+import mcp.types as types
+
+# Below this size the mmap setup cost outweighs the copy it saves.
+_MMAP_THRESHOLD = 64 * 1024
+
+# Text runs in a .docx body; pulling these straight from word/document.xml
+# skips loading python-docx's full OOXML object model.
+_W_T_RE = re.compile(r"<w:t[^>]*>([^<]*)</w:t>")
+
+# Listing hot loop: %-formatting on interned templates beats per-entry
+# f-strings here, and the indents (depth is capped at 10) are prebuilt.
+_DIR_LINE_FMT = "%s📁 %s/ - %s"
+_FILE_LINE_FMT = "%s📄 %s (%s) - %s"
+_INDENTS = tuple("  " * i for i in range(12))
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+# Spool directory for handle-mode results: oversized content lands here
+# and the tool returns a small uri/bytes/sha256 descriptor instead of
+# re-sending the payload through the context window on every turn. The
+# default is per-user (and created 0o700) so another local user cannot
+# pre-seed digest paths or read spooled content in a shared /tmp.
+_HANDLE_DIR = os.environ.get(
+    "MCP_HANDLE_DIR",
+    os.path.join(tempfile.gettempdir(), f"mcp-handles-{os.getuid()}"),
+)
+_DEFAULT_MAX_INLINE_BYTES = 65536
+
+# Path lookup done once at import; find_text's auto engine dispatches to
+# ripgrep's DFA scanner when the binary is on PATH.
+_RG_PATH = shutil.which("rg")
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_glob(pattern: str) -> "re.Pattern[str]":
+    """Compile a wildcard pattern once; agents re-send the same handful
+    of globs (*.py, *.md, ...) across calls, so the translate+compile
+    cost is paid per distinct pattern instead of per search."""
+    return re.compile(fnmatch.translate(pattern))
+
+
+def _scan_one_dir(path, match, match_hidden, recursive):
+    """Scan a single directory, returning (matching entries, subdirs)."""
+    matched: list[os.DirEntry] = []
+    subdirs: list[str] = []
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except (PermissionError, FileNotFoundError):
+        return matched, subdirs
+    for entry in entries:
+        if entry.name.startswith(".") and not match_hidden:
+            continue
+        if match(entry.name):
+            matched.append(entry)
+        if recursive and entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry.path)
+    return matched, subdirs
+
+
+def _iter_matches(root: str, pattern: str, recursive: bool) -> Iterator[os.DirEntry]:
+    """Yield DirEntry objects under ``root`` whose names match ``pattern``.
+
+    One scandir pass with the wildcard compiled up front, replacing
+    recursive glob, which re-stats every directory level and returns
+    plain strings the callers then had to stat again. Hidden entries are
+    skipped unless the pattern itself starts with a dot, matching glob.
+    """
+    match = _compile_glob(pattern).match
+    match_hidden = pattern.startswith(".")
+    pending = [root]
+    while pending:
+        matched, subdirs = _scan_one_dir(pending.pop(), match, match_hidden, recursive)
+        yield from matched
+        pending.extend(subdirs)
+
+
+def _collect_matches(
+    root: str, pattern: str, recursive: bool, max_workers: int = 1
+) -> list[os.DirEntry]:
+    """Like ``_iter_matches`` but optionally fanning directories out
+    across a thread pool, breadth-first one level at a time.
+
+    scandir and stat release the GIL, so on network filesystems and deep
+    trees the walk becomes metadata-latency bound and parallel workers
+    overlap those round trips. (Spinning disks can regress; callers keep
+    max_workers=1 there.)
+    """
+    if max_workers <= 1 or not recursive:
+        return list(_iter_matches(root, pattern, recursive))
+    match = _compile_glob(pattern).match
+    match_hidden = pattern.startswith(".")
+    results: list[os.DirEntry] = []
+    level = [root]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while level:
+            next_level: list[str] = []
+            for matched, subdirs in pool.map(
+                lambda p: _scan_one_dir(p, match, match_hidden, recursive), level
+            ):
+                results.extend(matched)
+                next_level.extend(subdirs)
+            level = next_level
+    return results
+
+
+class FileSystemTools:
+    """Implements the filesystem tools exposed by the unified server.
+
+    Each tool is an async wrapper that pushes the blocking filesystem
+    work onto the default thread pool with asyncio.to_thread, so slow
+    disks or network filesystems never stall the event loop; the
+    ``_sync_*`` counterparts do the actual work and return the final
+    response text.
+    """
+
+    async def read_file(self, args: dict[str, Any]) -> list[types.TextContent]:
+        text = await asyncio.to_thread(self._sync_read_file, args)
+        return [types.TextContent(type="text", text=text)]
+
+    def _sync_read_file(self, args: dict[str, Any]) -> str:
+        file_path = Path(args["file_path"]).resolve()
+        try:
+            if not file_path.is_file():
+                return f"Error: {file_path} is not a file"
+            if file_path.suffix.lower() == ".docx":
+                with zipfile.ZipFile(file_path) as z:
+                    with z.open("word/document.xml") as f:
+                        xml = f.read().decode("utf-8")
+                content = "\n".join(_W_T_RE.findall(xml))
+            else:
+                content = self._read_text(file_path)
+            return self._maybe_handle(args, f"Contents of {file_path}:\n\n{content}")
+        except Exception as e:
+            return f"Error reading file: {e}"
+
+    @staticmethod
+    def _maybe_handle(args: dict[str, Any], text: str) -> str:
+        """Spool ``text`` to a content-addressed file when the caller asked
+        for handle mode or the result exceeds its inline budget."""
+        return_mode = args.get("return_mode", "inline")
+        max_inline = args.get("max_inline_bytes", _DEFAULT_MAX_INLINE_BYTES)
+        data = text.encode("utf-8")
+        if return_mode != "handle" and len(data) <= max_inline:
+            return text
+        digest = hashlib.sha256(data).hexdigest()
+        os.makedirs(_HANDLE_DIR, mode=0o700, exist_ok=True)
+        dir_stat = os.stat(_HANDLE_DIR)
+        if dir_stat.st_uid != os.getuid() or dir_stat.st_mode & 0o077:
+            # Someone else owns the spool dir (or it is group/world
+            # accessible): don't trust it, return the content inline.
+            return text
+        handle_path = os.path.join(_HANDLE_DIR, digest)
+        reuse = False
+        if os.path.exists(handle_path):
+            # Content-addressed, but only reusable if the bytes on disk
+            # actually hash to this digest; anything else gets rewritten.
+            with open(handle_path, "rb") as f:
+                reuse = hashlib.sha256(f.read()).hexdigest() == digest
+        if not reuse:
+            fd = os.open(handle_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+        return json.dumps(
+            {"uri": f"file://{handle_path}", "bytes": len(data), "sha256": digest}
+        )
+
+    @staticmethod
+    def _read_text(file_path: Path) -> str:
+        """Read a text file, mmapping larger files for zero-copy access.
+
+        The mapping reads the page cache in place instead of copying the
+        whole file through a userspace buffer first; small files keep a
+        single raw os.read, where mmap setup would dominate. Decoding is
+        lenient: local content is trusted, so strict validation would
+        only pay a second scan to reject the occasional stray byte.
+        """
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            if size < _MMAP_THRESHOLD:
+                # One raw read on the already-open fd; skips the
+                # BufferedReader layer (and its seek/isatty syscalls)
+                # that read_text would set up just to drain the file.
+                return os.read(fd, size).decode("utf-8", errors="replace")
+            with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                return bytes(mm).decode("utf-8", errors="replace")
+        finally:
+            os.close(fd)
+
+    async def write_file(self, args: dict[str, Any]) -> list[types.TextContent]:
+        text = await asyncio.to_thread(self._sync_write_file, args)
+        return [types.TextContent(type="text", text=text)]
+
+    def _sync_write_file(self, args: dict[str, Any]) -> str:
+        file_path = Path(args["file_path"]).resolve()
+        content = args["content"]
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            # Single open/write/close on a raw fd instead of the
+            # TextIOWrapper/BufferedWriter stack write_text builds.
+            data = content.encode("utf-8")
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+            return f"Wrote {len(content)} characters to {file_path}"
+        except Exception as e:
+            return f"Error writing file: {e}"
+
+    async def append_file(self, args: dict[str, Any]) -> list[types.TextContent]:
+        text = await asyncio.to_thread(self._sync_append_file, args)
+        return [types.TextContent(type="text", text=text)]
+
+    def _sync_append_file(self, args: dict[str, Any]) -> str:
+        file_path = Path(args["file_path"]).resolve()
+        content = args["content"]
+        try:
+            # O_APPEND positions at end-of-file in the kernel, so one raw
+            # write lands atomically even with concurrent appenders — no
+            # TextIOWrapper/BufferedWriter stack for a single-shot append.
+            data = content.encode("utf-8")
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+            return f"Appended {len(content)} characters to {file_path}"
+        except Exception as e:
+            return f"Error appending to file: {e}"
+
+    async def create_directory(self, args: dict[str, Any]) -> list[types.TextContent]:
+        text = await asyncio.to_thread(self._sync_create_directory, args)
+        return [types.TextContent(type="text", text=text)]
+
+    def _sync_create_directory(self, args: dict[str, Any]) -> str:
+        directory_path = Path(args["directory_path"]).resolve()
+        try:
+            directory_path.mkdir(parents=True, exist_ok=True)
+            return f"Created directory {directory_path}"
+        except Exception as e:
+            return f"Error creating directory: {e}"
+
+    async def list_directory(self, args: dict[str, Any]) -> list[types.TextContent]:
+        text = await asyncio.to_thread(self._sync_list_directory, args)
+        return [types.TextContent(type="text", text=text)]
+
+    def _sync_list_directory(self, args: dict[str, Any]) -> str:
+        directory_path = Path(args["directory_path"]).resolve()
+        recursive = args.get("recursive", False)
+        include_hidden = args.get("include_hidden", False)
+        include_metadata = args.get("include_metadata", False)
+        try:
+            if not directory_path.is_dir():
+                return f"Error: {directory_path} is not a directory"
+
+            items: list[str] = []
+
+            def scan_directory(path: str, depth: int = 0) -> None:
+                if depth > 10:
+                    return
+                # DirEntry serves is_dir/is_file from the getdents batch
+                # and caches its stat, instead of a stat syscall for each.
+                with os.scandir(path) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+                for entry in entries:
+                    if not include_hidden and entry.name.startswith("."):
+                        continue
+                    indent = _INDENTS[depth]
+                    if not include_metadata:
+                        # Names-only fast path: the type flag comes from
+                        # the directory read itself, so no entry is ever
+                        # stat'ed — one syscall per directory block.
+                        if entry.is_dir(follow_symlinks=False):
+                            items.append(f"{indent}📁 {entry.name}/")
+                            if recursive:
+                                scan_directory(entry.path, depth + 1)
+                        elif entry.is_file(follow_symlinks=False):
+                            items.append(f"{indent}📄 {entry.name}")
+                        continue
+                    stat = entry.stat(follow_symlinks=False)
+                    # libc strftime directly; no datetime object per entry.
+                    modified = time.strftime(
+                        "%Y-%m-%d %H:%M:%S", time.localtime(stat.st_mtime)
+                    )
+                    if entry.is_dir(follow_symlinks=False):
+                        items.append(
+                            _DIR_LINE_FMT % (indent, entry.name, modified)
+                        )
+                        if recursive:
+                            scan_directory(entry.path, depth + 1)
+                    elif entry.is_file(follow_symlinks=False):
+                        size = self._human_readable_size(stat.st_size)
+                        items.append(
+                            _FILE_LINE_FMT % (indent, entry.name, size, modified)
+                        )
+
+            scan_directory(str(directory_path))
+            listing = "\n".join(items) if items else "(empty)"
+            return f"Directory: {directory_path}\n\n{listing}"
+        except Exception as e:
+            return f"Error listing directory: {e}"
+
+    async def list_directory_stat(
+        self, args: dict[str, Any]
+    ) -> list[types.TextContent]:
+        text = await asyncio.to_thread(self._sync_list_directory_stat, args)
+        return [types.TextContent(type="text", text=text)]
+
+    def _sync_list_directory_stat(self, args: dict[str, Any]) -> str:
+        """One scandir pass per directory: each DirEntry carries the stat
+        data from the directory read itself, so no follow-up stat per
+        entry the way list_directory + file_info would."""
+        directory_path = Path(args["directory_path"]).resolve()
+        recursive = args.get("recursive", False)
+        include_hidden = args.get("include_hidden", False)
+        fields = args.get("fields") or ["size", "mtime", "is_dir"]
+        try:
+            if not directory_path.is_dir():
+                return f"Error: {directory_path} is not a directory"
+            records: list[dict[str, Any]] = []
+            stack = [str(directory_path)]
+            while stack:
+                current = stack.pop()
+                with os.scandir(current) as it:
+                    children = sorted(it, key=lambda e: e.name)
+                for entry in children:
+                    if not include_hidden and entry.name.startswith("."):
+                        continue
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    record: dict[str, Any] = {"path": entry.path}
+                    st = entry.stat(follow_symlinks=False)
+                    if "size" in fields:
+                        record["size"] = st.st_size
+                    if "mtime" in fields:
+                        record["mtime"] = time.strftime(
+                            "%Y-%m-%d %H:%M:%S", time.localtime(st.st_mtime)
+                        )
+                    if "mode" in fields:
+                        record["mode"] = oct(st.st_mode)[-3:]
+                    if "is_dir" in fields:
+                        record["is_dir"] = is_dir
+                    if "is_symlink" in fields:
+                        record["is_symlink"] = entry.is_symlink()
+                    records.append(record)
+                    if recursive and is_dir:
+                        stack.append(entry.path)
+            return json.dumps(records, indent=2)
+        except Exception as e:
+            return f"Error listing directory: {e}"
+
+    async def delete_file(self, args: dict[str, Any]) -> list[types.TextContent]:
+        text = await asyncio.to_thread(self._sync_delete_file, args)
+        return [types.TextContent(type="text", text=text)]
+
+    def _sync_delete_file(self, args: dict[str, Any]) -> str:
+        file_path = Path(args["file_path"]).resolve()
+        recursive = args.get("recursive", False)
+        max_workers = args.get("max_workers", 1)
+        try:
+            if not file_path.exists():
+                return f"Error: {file_path} does not exist"
+            if file_path.is_file():
+                file_path.unlink()
+                return f"Deleted file {file_path}"
+            if file_path.is_dir():
+                if not recursive:
+                    return (
+                        f"Error: {file_path} is a directory (use recursive=true)"
+                    )
+                if max_workers > 1:
+                    # Fan top-level subtrees out across the pool; rmtree
+                    # is unlink/rmdir syscalls all the way down, so the
+                    # GIL is released for most of each subtree.
+                    subtrees = [e.path for e in os.scandir(file_path)]
+                    with concurrent.futures.ThreadPoolExecutor(
+                        max_workers=max_workers
+                    ) as pool:
+                        list(
+                            pool.map(
+                                lambda p: shutil.rmtree(p)
+                                if os.path.isdir(p) and not os.path.islink(p)
+                                else os.unlink(p),
+                                subtrees,
+                            )
+                        )
+                shutil.rmtree(file_path)
+                return f"Deleted directory {file_path}"
+            return f"Error: cannot delete {file_path}"
+        except Exception as e:
+            return f"Error deleting: {e}"
+
+    async def move_file(self, args: dict[str, Any]) -> list[types.TextContent]:
+        text = await asyncio.to_thread(self._sync_move_file, args)
+        return [types.TextContent(type="text", text=text)]
+
+    def _sync_move_file(self, args: dict[str, Any]) -> str:
+        source_path = Path(args["source_path"]).resolve()
+        destination_path = Path(args["destination_path"]).resolve()
+        try:
+            if not source_path.exists():
+                return f"Error: {source_path} does not exist"
+            destination_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(source_path), str(destination_path))
+            return f"Moved {source_path} to {destination_path}"
+        except Exception as e:
+            return f"Error moving: {e}"
+
+    async def copy_file(self, args: dict[str, Any]) -> list[types.TextContent]:
+        text = await asyncio.to_thread(self._sync_copy_file, args)
+        return [types.TextContent(type="text", text=text)]
+
+    def _sync_copy_file(self, args: dict[str, Any]) -> str:
+        source_path = Path(args["source_path"]).resolve()
+        destination_path = Path(args["destination_path"]).resolve()
+        preserve_metadata = args.get("preserve_metadata", False)
+        try:
+            if not source_path.exists():
+                return f"Error: {source_path} does not exist"
+            destination_path.parent.mkdir(parents=True, exist_ok=True)
+            # copyfile lets the kernel do the copy via copy_file_range/
+            # sendfile with no userspace byte shuffling; copy2 tacks on
+            # the utime/chmod/chown metadata syscalls, so it is opt-in.
+            copy_function = shutil.copy2 if preserve_metadata else shutil.copyfile
+            if source_path.is_file():
+                copy_function(source_path, destination_path)
+            else:
+                shutil.copytree(
+                    source_path,
+                    destination_path,
+                    dirs_exist_ok=True,
+                    copy_function=copy_function,
+                )
+            return f"Copied {source_path} to {destination_path}"
+        except Exception as e:
+            return f"Error copying: {e}"
+
+    async def search_files(self, args: dict[str, Any]) -> list[types.TextContent]:
+        text = await asyncio.to_thread(self._sync_search_files, args)
+        return [types.TextContent(type="text", text=text)]
+
+    def _sync_search_files(self, args: dict[str, Any]) -> str:
+        directory_path = Path(args["directory_path"]).resolve()
+        pattern = args["pattern"]
+        recursive = args.get("recursive", True)
+        use_regex = args.get("regex", False)
+        max_results = args.get("max_results", 0)
+        max_workers = args.get("max_workers", 1)
+        try:
+            if not directory_path.is_dir():
+                return f"Error: {directory_path} is not a directory"
+            if use_regex:
+                # Regex mode walks everything and filters names with one
+                # compiled pattern; name globbing stays on the fast path.
+                name_re = re.compile(pattern)
+                entries = [
+                    e
+                    for e in _collect_matches(
+                        str(directory_path), "*", recursive, max_workers
+                    )
+                    if name_re.search(e.name)
+                ]
+            else:
+                entries = _collect_matches(
+                    str(directory_path), pattern, recursive, max_workers
+                )
+            entries.sort(key=lambda e: e.path)
+            if max_results:
+                entries = entries[:max_results]
+
+            # One comprehension over the sorted entries; sizes reuse the
+            # stat already cached on each DirEntry by the walk.
+            human = self._human_readable_size
+            results = [
+                f"📄 {e.path} ({human(e.stat(follow_symlinks=False).st_size)})"
+                if e.is_file(follow_symlinks=False)
+                else f"📁 {e.path}"
+                for e in entries
+                if e.is_file(follow_symlinks=False) or e.is_dir(follow_symlinks=False)
+            ]
+
+            if not results:
+                return f"No files matching '{pattern}' in {directory_path}"
+            return (
+                f"Found {len(results)} matches for '{pattern}' "
+                f"in {directory_path}:\n\n" + "\n".join(results)
+            )
+        except Exception as e:
+            return f"Error searching: {e}"
+
+    async def find_text(self, args: dict[str, Any]) -> list[types.TextContent]:
+        text = await asyncio.to_thread(self._sync_find_text, args)
+        return [types.TextContent(type="text", text=text)]
+
+    def _sync_find_text(self, args: dict[str, Any]) -> str:
+        directory_path = Path(args["directory_path"]).resolve()
+        search_text = args["search_text"]
+        file_pattern = args.get("file_pattern", "*")
+        case_sensitive = args.get("case_sensitive", False)
+        engine = args.get("engine", "auto")
+        use_regex = args.get("regex", False)
+        max_results = args.get("max_results", 0)
+        max_workers = args.get("max_workers", 1)
+        try:
+            if not directory_path.is_dir():
+                return f"Error: {directory_path} is not a directory"
+            if engine == "ripgrep" and _RG_PATH is None:
+                return "Error: ripgrep requested but rg is not on PATH"
+            if _RG_PATH is not None and engine in ("auto", "ripgrep"):
+                return self._maybe_handle(
+                    args,
+                    self._find_text_ripgrep(
+                        directory_path,
+                        search_text,
+                        file_pattern,
+                        case_sensitive,
+                        use_regex,
+                        max_results,
+                    ),
+                )
+            files = sorted(
+                entry.path
+                for entry in _collect_matches(
+                    str(directory_path), file_pattern, True, max_workers
+                )
+                if entry.is_file(follow_symlinks=False)
+            )
+            # Search as bytes so non-matching lines are never decoded;
+            # bytes .lower() folds ASCII, which covers the wildcard-file
+            # search this tool is used for. Regex mode swaps the C-level
+            # substring scan for a compiled pattern over the same bytes.
+            needle_re = None
+            needle = b""
+            if use_regex:
+                needle_re = re.compile(
+                    search_text.encode("utf-8"),
+                    0 if case_sensitive else re.IGNORECASE,
+                )
+            else:
+                needle = search_text.encode("utf-8")
+                if not case_sensitive:
+                    needle = needle.lower()
+
+            def scan_file(file_str: str) -> list[str]:
+                try:
+                    with open(file_str, "rb") as f:
+                        raw = f.read()
+                except (PermissionError, OSError):
+                    return []
+                # Fast pre-check: one scan decides whether the file is
+                # worth line accounting at all, so non-matching files
+                # (the common case) cost a single pass over the raw
+                # bytes. bytes.lower preserves length, so offsets in the
+                # folded copy map 1:1 onto raw.
+                match_len = len(needle) or 1
+                if needle_re is None:
+                    haystack = raw if case_sensitive else raw.lower()
+                    pos = haystack.find(needle)
+                else:
+                    haystack = raw
+                    m = needle_re.search(raw)
+                    pos = m.start() if m else -1
+                    if m:
+                        match_len = (m.end() - m.start()) or 1
+                if pos < 0:
+                    return []
+                file_matches: list[str] = []
+                more = 0
+                line_num = 1
+                scanned_to = 0
+                while pos >= 0:
+                    if len(file_matches) < 5:
+                        line_start = raw.rfind(b"\n", 0, pos) + 1
+                        line_end = raw.find(b"\n", pos)
+                        if line_end < 0:
+                            line_end = len(raw)
+                        line_num += haystack.count(b"\n", scanned_to, pos)
+                        scanned_to = pos
+                        text = raw[line_start:line_end].decode(
+                            "utf-8", errors="replace"
+                        )
+                        file_matches.append(f"  {line_num}: {text.strip()}")
+                        # Jump past the line so it is reported once.
+                        next_from = line_end + 1
+                    else:
+                        more += 1
+                        next_from = pos + match_len
+                    if needle_re is None:
+                        pos = haystack.find(needle, next_from)
+                    else:
+                        m = needle_re.search(raw, next_from)
+                        if m:
+                            pos = m.start()
+                            match_len = (m.end() - m.start()) or 1
+                        else:
+                            pos = -1
+                out = [f"📄 {file_str}:", *file_matches]
+                if more:
+                    out.append(f"  ... and {more} more occurrences")
+                return out
+
+            # map preserves input order, so parallel scans still report
+            # files in sorted order.
+            if max_workers > 1 and len(files) > 1:
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max_workers
+                ) as pool:
+                    per_file = list(pool.map(scan_file, files))
+            else:
+                per_file = [scan_file(f) for f in files]
+
+            # Assemble under the cap: only match lines count as results
+            # (never the header or the occurrences trailer), and a file's
+            # lines are truncated mid-chunk when the budget runs out,
+            # like the ripgrep path's lines[:max_results].
+            matches: list[str] = []
+            reported = 0
+            for chunk in per_file:
+                if not chunk:
+                    continue
+                header, body = chunk[0], chunk[1:]
+                trailer = None
+                if body and body[-1].startswith("  ... and"):
+                    trailer = body.pop()
+                if max_results:
+                    remaining = max_results - reported
+                    if len(body) > remaining:
+                        body = body[:remaining]
+                        trailer = None
+                matches.append(header)
+                matches.extend(body)
+                if trailer:
+                    matches.append(trailer)
+                reported += len(body)
+                if max_results and reported >= max_results:
+                    break
+
+            if not matches:
+                return f"No occurrences of '{search_text}' in {directory_path}"
+            return self._maybe_handle(
+                args,
+                f"Occurrences of '{search_text}' in {directory_path}:\n\n"
+                + "\n".join(matches),
+            )
+        except Exception as e:
+            return f"Error searching text: {e}"
+
+    def _find_text_ripgrep(
+        self,
+        directory_path: Path,
+        search_text: str,
+        file_pattern: str,
+        case_sensitive: bool,
+        use_regex: bool,
+        max_results: int,
+    ) -> str:
+        """Delegate the scan to ripgrep's DFA engine, reformatting its
+        path:line:text output into the tool's usual grouped report."""
+        cmd = [_RG_PATH, "--line-number", "--no-heading", "--color", "never"]
+        # Keep the two engines in agreement on the same tree: the python
+        # fallback does not honor .gitignore, caps at 5 lines per file,
+        # and only descends into hidden entries when the file pattern
+        # itself starts with a dot.
+        cmd.extend(("--no-ignore", "--max-count", "5"))
+        if file_pattern.startswith("."):
+            cmd.append("--hidden")
+        if not case_sensitive:
+            cmd.append("--ignore-case")
+        if not use_regex:
+            cmd.append("--fixed-strings")
+        if file_pattern and file_pattern != "*":
+            cmd.extend(("--glob", file_pattern))
+        cmd.extend(("--", search_text, str(directory_path)))
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+        if proc.returncode not in (0, 1):
+            raise RuntimeError(proc.stderr.strip() or f"rg exited {proc.returncode}")
+        lines = proc.stdout.splitlines()
+        if not lines:
+            return f"No occurrences of '{search_text}' in {directory_path}"
+        if max_results:
+            lines = lines[:max_results]
+        grouped: list[str] = []
+        current = None
+        for line in lines:
+            path, _, rest = line.partition(":")
+            num, _, text = rest.partition(":")
+            if path != current:
+                grouped.append(f"📄 {path}:")
+                current = path
+            grouped.append(f"  {num}: {text.strip()}")
+        return (
+            f"Occurrences of '{search_text}' in {directory_path}:\n\n"
+            + "\n".join(grouped)
+        )
+
+    async def file_info(self, args: dict[str, Any]) -> list[types.TextContent]:
+        text = await asyncio.to_thread(self._sync_file_info, args)
+        return [types.TextContent(type="text", text=text)]
+
+    def _sync_file_info(self, args: dict[str, Any]) -> str:
+        file_path = Path(args["file_path"]).resolve()
+        try:
+            if not file_path.exists():
+                return f"Error: {file_path} does not exist"
+            stat = file_path.stat()
+            info: dict[str, Any] = {
+                "path": str(file_path),
+                "type": "directory" if file_path.is_dir() else "file",
+                "size": stat.st_size,
+                "size_human": self._human_readable_size(stat.st_size),
+                "modified": time.strftime(
+                    "%Y-%m-%d %H:%M:%S", time.localtime(stat.st_mtime)
+                ),
+                "created": time.strftime(
+                    "%Y-%m-%d %H:%M:%S", time.localtime(stat.st_ctime)
+                ),
+                "permissions": oct(stat.st_mode)[-3:],
+            }
+            if file_path.is_dir():
+                try:
+                    # Count the scandir stream; no Path object per child.
+                    info["item_count"] = sum(1 for _ in os.scandir(file_path))
+                except PermissionError:
+                    info["item_count"] = "permission denied"
+            return json.dumps(info, indent=2)
+        except Exception as e:
+            return f"Error getting file info: {e}"
+
+    # Batched variants: one tool turn covers many paths, and the sync
+    # work fans out across the thread pool instead of serializing N
+    # round trips through the client.
+
+    async def read_batch(self, args: dict[str, Any]) -> list[types.TextContent]:
+        texts = await asyncio.gather(
+            *(
+                asyncio.to_thread(self._sync_read_file, {"file_path": p})
+                for p in args["file_paths"]
+            )
+        )
+        return [types.TextContent(type="text", text=t) for t in texts]
+
+    async def file_info_batch(self, args: dict[str, Any]) -> list[types.TextContent]:
+        texts = await asyncio.gather(
+            *(
+                asyncio.to_thread(self._sync_file_info, {"file_path": p})
+                for p in args["file_paths"]
+            )
+        )
+        return [types.TextContent(type="text", text=t) for t in texts]
+
+    async def search_files_batch(
+        self, args: dict[str, Any]
+    ) -> list[types.TextContent]:
+        texts = await asyncio.gather(
+            *(asyncio.to_thread(self._sync_search_files, q) for q in args["queries"])
+        )
+        return [types.TextContent(type="text", text=t) for t in texts]
+
+    async def find_text_batch(self, args: dict[str, Any]) -> list[types.TextContent]:
+        texts = await asyncio.gather(
+            *(asyncio.to_thread(self._sync_find_text, q) for q in args["queries"])
+        )
+        return [types.TextContent(type="text", text=t) for t in texts]
+
+    @staticmethod
+    def _human_readable_size(size: int) -> str:
+        # Unit index straight from the bit length: one shift and one
+        # divide instead of a Python loop of float divisions.
+        if size < 1024:
+            return f"{size} B"
+        i = min((size.bit_length() - 1) // 10, 5)
+        return f"{size / (1 << (i * 10)):.1f} {_SIZE_UNITS[i]}"
@@ -0,0 +1,109 @@
+"""Odoo tool implementations for the unified MCP server."""
+
+import asyncio
+import concurrent.futures
+import re
+from typing import Any, Callable, TypeVar
+
+import mcp.types as types
+
+from .odoo_connector import OdooConnector, normalize_vat
+
+# Compiled once at import; get_contact_info runs this on every prompt.
+_VAT_EXTRACT_RE = re.compile(r"\b([A-Z0-9-]{7,15})\b", re.IGNORECASE)
+
+_T = TypeVar("_T")
+
+# The full res.partner detail set, built once instead of per call.
+_FULL_FIELDS = (
+    "name",
+    "vat",
+    "contact_address_complete",
+    "phone",
+    "mobile",
+    "email",
+    "function",
+    "website",
+)
+
+
+class OdooTools:
+    """Implements the Odoo tools exposed by the unified server."""
+
+    def __init__(
+        self, executor: concurrent.futures.Executor | None = None
+    ) -> None:
+        self.connector: OdooConnector | None = None
+        # Dedicated executor (a single "odoo-rpc" thread in the unified
+        # server) so RPC calls never wait behind filesystem work in the
+        # shared to_thread pool and the HTTP session stays on one thread.
+        self._odoo_exec = executor
+
+    async def _run(self, func: Callable[[], _T]) -> _T:
+        if self._odoo_exec is None:
+            return await asyncio.to_thread(func)
+        return await asyncio.get_running_loop().run_in_executor(
+            self._odoo_exec, func
+        )
+
+    async def configure_odoo(self, args: dict[str, Any]) -> list[types.TextContent]:
+        def sync_connect() -> str:
+            connector = OdooConnector(
+                args["url"], args["db"], args["username"], args["password"]
+            )
+            uid = connector.connect()
+            self.connector = connector
+            return f"Connected to Odoo at {connector.url} as uid {uid}"
+
+        try:
+            text = await self._run(sync_connect)
+        except Exception as e:
+            text = f"Error configuring Odoo: {e}"
+        return [types.TextContent(type="text", text=text)]
+
+    async def get_contact_info(self, args: dict[str, Any]) -> list[types.TextContent]:
+        text = await self._run(lambda: self._sync_get_contact_info(args))
+        return [types.TextContent(type="text", text=text)]
+
+    def _sync_get_contact_info(self, args: dict[str, Any]) -> str:
+        prompt = args["prompt"]
+        if self.connector is None:
+            return "Error: Odoo is not configured (call configure_odoo first)"
+        match = _VAT_EXTRACT_RE.search(prompt)
+        if match is None:
+            return "Error: no VAT number found in the request"
+        vat = match.group(1)
+        normalized_vat_prompt = normalize_vat(vat)
+
+        fields_to_query = list(_FULL_FIELDS)
+        try:
+            # A bounded query: 20 rows is plenty to detect ambiguity, and
+            # it stops a broad ilike match from shipping a full scan back.
+            candidates = self.connector.search_read(
+                "res.partner", [["vat", "ilike", vat]], fields_to_query, limit=20
+            )
+        except Exception as e:
+            return f"Error querying Odoo: {e}"
+
+        found_partners = []
+        for p in candidates:
+            v = p.get("vat")
+            if v and normalize_vat(v) == normalized_vat_prompt:
+                found_partners.append(p)
+                if len(found_partners) >= 2:
+                    # Two hits already prove ambiguity; stop normalizing
+                    # the remaining candidates' VATs.
+                    break
+        if not found_partners:
+            return f"No partner found with VAT {vat}"
+        if len(found_partners) > 1:
+            names = ", ".join(p.get("name", "?") for p in found_partners)
+            return f"Multiple partners share VAT {vat}: {names}"
+
+        partner = found_partners[0]
+        lines = [f"Contact information for VAT {vat}:"]
+        for field in fields_to_query:
+            value = partner.get(field)
+            if value:
+                lines.append(f"  {field}: {value}")
+        return "\n".join(lines)
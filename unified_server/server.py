@@ -0,0 +1,111 @@
+"""Unified MCP server exposing filesystem and Odoo tools over stdio."""
+
+import asyncio
+import concurrent.futures
+from typing import Any, Awaitable, Callable
+
+import mcp.types as types
+from mcp.server import Server
+from mcp.server.stdio import stdio_server
+
+from . import tools
+from .filesystem_tools import FileSystemTools
+from .odoo_tools import OdooTools
+
+
+class UnifiedServer:
+    """Routes MCP tool calls to the filesystem and Odoo tool sets."""
+
+    def __init__(self) -> None:
+        self.server = Server("unified-server")
+        self.fs_tools = FileSystemTools()
+        # All Odoo RPC work runs on one dedicated thread, so the
+        # connector's HTTP session stays warm and thread-affine instead
+        # of hopping across the shared to_thread pool.
+        self._odoo_exec = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="odoo-rpc"
+        )
+        self.odoo_tools = OdooTools(executor=self._odoo_exec)
+        self.setup_handlers()
+
+    def setup_handlers(self) -> None:
+        # One hash lookup per call instead of walking an if/elif chain of
+        # string comparisons on every RPC.
+        self._tool_map: dict[
+            str, Callable[[dict[str, Any]], Awaitable[list[types.TextContent]]]
+        ] = {
+            "read_file": self.fs_tools.read_file,
+            "write_file": self.fs_tools.write_file,
+            "append_file": self.fs_tools.append_file,
+            "create_directory": self.fs_tools.create_directory,
+            "list_directory": self.fs_tools.list_directory,
+            "list_directory_stat": self.fs_tools.list_directory_stat,
+            "delete_file": self.fs_tools.delete_file,
+            "move_file": self.fs_tools.move_file,
+            "copy_file": self.fs_tools.copy_file,
+            "search_files": self.fs_tools.search_files,
+            "find_text": self.fs_tools.find_text,
+            "file_info": self.fs_tools.file_info,
+            "read_batch": self.fs_tools.read_batch,
+            "file_info_batch": self.fs_tools.file_info_batch,
+            "search_files_batch": self.fs_tools.search_files_batch,
+            "find_text_batch": self.fs_tools.find_text_batch,
+            "configure_odoo": self.odoo_tools.configure_odoo,
+            "get_contact_info": self.odoo_tools.get_contact_info,
+            "discover_tools": self.discover_tools,
+        }
+
+        @self.server.list_tools()
+        async def handle_list_tools() -> list[types.Tool]:
+            return tools.get_all_tools()
+
+        @self.server.call_tool()
+        async def handle_call_tool(
+            name: str, arguments: dict[str, Any]
+        ) -> list[types.TextContent]:
+            return await self.call_tool(name, arguments)
+
+    async def call_tool(
+        self, name: str, arguments: dict[str, Any]
+    ) -> list[types.TextContent]:
+        handler = self._tool_map.get(name)
+        if handler is None:
+            raise ValueError(f"Unknown tool: {name}")
+        # Compiled per-tool validator (None when fastjsonschema is not
+        # installed); bad arguments are rejected here instead of surfacing
+        # as arbitrary handler errors.
+        validator = tools.get_validator(name)
+        if validator is not None:
+            try:
+                validator(arguments)
+            except Exception as e:
+                return [
+                    types.TextContent(
+                        type="text", text=f"Invalid arguments for {name}: {e}"
+                    )
+                ]
+        return await handler(arguments)
+
+    async def discover_tools(
+        self, arguments: dict[str, Any]
+    ) -> list[types.TextContent]:
+        if tools.enable_extended_tools():
+            await self.server.request_context.session.send_tool_list_changed()
+            text = "Extended tools enabled; list tools again for the full set"
+        else:
+            text = "Extended tools are already enabled"
+        return [types.TextContent(type="text", text=text)]
+
+
+async def main() -> None:
+    unified = UnifiedServer()
+    async with stdio_server() as (read_stream, write_stream):
+        await unified.server.run(
+            read_stream,
+            write_stream,
+            unified.server.create_initialization_options(),
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,618 @@
+"""Tool definitions for the unified MCP server."""
+
+from __future__ import annotations
+
+import functools
+import importlib.resources
+import json
+import os
+from collections import namedtuple
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import mcp.types as types
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - optional speedup
+    fastjsonschema = None
+
+# inputSchema JSON bytes by tool name, encoded once so tools/list-style
+# consumers can splice cached bytes instead of re-walking the dicts.
+_SCHEMA_JSON_CACHE: dict[str, bytes] = {}
+
+# Flipped by the discover_tools handler once a session asks for the
+# extended set; until then lazy mode advertises only the core tools.
+_extended_enabled = False
+
+
+# Property fragments shared across several tool schemas; referencing one
+# dict per fragment halves the dict allocations in get_all_tools.
+_FILE_PATH_PROP = {"type": "string", "description": "Path to the file"}
+_DIRECTORY_PATH_PROP = {"type": "string", "description": "Path of the directory"}
+_CONTENT_PROP = {"type": "string", "description": "Content to write"}
+_SOURCE_PATH_PROP = {"type": "string", "description": "Path to copy or move from"}
+_DESTINATION_PATH_PROP = {"type": "string", "description": "Path to copy or move to"}
+_RECURSIVE_PROP = {
+    "type": "boolean",
+    "description": "Recurse into subdirectories",
+    "default": False,
+}
+_MAX_WORKERS_PROP = {
+    "type": "integer",
+    "minimum": 1,
+    "maximum": 64,
+    "description": (
+        "Worker threads for the recursive walk; helps on network "
+        "filesystems, may regress on spinning disks"
+    ),
+    "default": 1,
+}
+
+# Handle-mode knobs shared by the tools whose output can outgrow the
+# context window; in handle mode the server returns a uri/bytes/sha256
+# descriptor pointing at spooled content instead of the content itself.
+_RETURN_MODE_PROP = {
+    "type": "string",
+    "enum": ["inline", "handle"],
+    "description": "Return content inline or as a content handle",
+    "default": "inline",
+}
+_MAX_INLINE_BYTES_PROP = {
+    "type": "integer",
+    "description": "Largest result returned inline before switching to a handle",
+    "default": 65536,
+}
+
+_READ_FILE_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "file_path": _FILE_PATH_PROP,
+        "return_mode": _RETURN_MODE_PROP,
+        "max_inline_bytes": _MAX_INLINE_BYTES_PROP,
+    },
+    "required": ["file_path"],
+})
+
+_WRITE_FILE_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "file_path": _FILE_PATH_PROP,
+        "content": _CONTENT_PROP,
+    },
+    "required": ["file_path", "content"],
+})
+
+_APPEND_FILE_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "file_path": _FILE_PATH_PROP,
+        "content": _CONTENT_PROP,
+    },
+    "required": ["file_path", "content"],
+})
+
+_CREATE_DIRECTORY_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "directory_path": _DIRECTORY_PATH_PROP,
+    },
+    "required": ["directory_path"],
+})
+
+_LIST_DIRECTORY_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "directory_path": _DIRECTORY_PATH_PROP,
+        "recursive": _RECURSIVE_PROP,
+        "include_hidden": {
+            "type": "boolean",
+            "description": "Include entries starting with a dot",
+            "default": False,
+        },
+        "include_metadata": {
+            "type": "boolean",
+            "description": (
+                "Include size and mtime per entry; the default "
+                "names-only listing is much cheaper"
+            ),
+            "default": False,
+        },
+    },
+    "required": ["directory_path"],
+})
+
+_LIST_DIRECTORY_STAT_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "directory_path": _DIRECTORY_PATH_PROP,
+        "recursive": _RECURSIVE_PROP,
+        "include_hidden": {
+            "type": "boolean",
+            "description": "Include entries starting with a dot",
+            "default": False,
+        },
+        "fields": {
+            "type": "array",
+            "items": {"enum": ["size", "mtime", "mode", "is_dir", "is_symlink"]},
+            "description": "Metadata to include for each entry",
+        },
+    },
+    "required": ["directory_path"],
+})
+
+_DELETE_FILE_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "file_path": _FILE_PATH_PROP,
+        "recursive": _RECURSIVE_PROP,
+        "max_workers": _MAX_WORKERS_PROP,
+    },
+    "required": ["file_path"],
+})
+
+# The bare source/destination object, shared by every tool whose
+# arguments are exactly a src/dst pair. copy_file adds
+# preserve_metadata, so it keeps its own schema built from the same
+# property constants.
+_SRC_DST_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "source_path": _SOURCE_PATH_PROP,
+        "destination_path": _DESTINATION_PATH_PROP,
+    },
+    "required": ["source_path", "destination_path"],
+})
+
+_MOVE_FILE_SCHEMA = _SRC_DST_SCHEMA
+
+_COPY_FILE_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "source_path": _SOURCE_PATH_PROP,
+        "destination_path": _DESTINATION_PATH_PROP,
+        "preserve_metadata": {
+            "type": "boolean",
+            "description": "Also copy permissions and timestamps",
+            "default": False,
+        },
+    },
+    "required": ["source_path", "destination_path"],
+})
+
+# Search knobs: regex and max_results are shared by search_files and
+# find_text; the engine hint applies to find_text only, since
+# search_files' name globbing is already a single in-process scan with
+# nothing to dispatch to. auto picks ripgrep when the binary is on PATH
+# and falls back to compiled re. (The source proposal also listed
+# hyperscan, but no bindings exist in this tree.)
+_ENGINE_PROP = {
+    "type": "string",
+    "enum": ["auto", "python", "ripgrep"],
+    "description": "Search engine to use",
+    "default": "auto",
+}
+_REGEX_PROP = {
+    "type": "boolean",
+    "description": "Treat the pattern as a regular expression",
+    "default": False,
+}
+_MAX_RESULTS_PROP = {
+    "type": "integer",
+    "description": "Stop after this many results (0 = unlimited)",
+    "default": 0,
+}
+
+# The query bodies stay plain dicts so the batch schemas can embed them
+# as array items; the single-call schemas wrap the same objects.
+_SEARCH_FILES_QUERY = {
+    "type": "object",
+    "properties": {
+        "directory_path": _DIRECTORY_PATH_PROP,
+        "pattern": {
+            "type": "string",
+            "description": "Wildcard pattern, e.g. *.py",
+        },
+        "recursive": {
+            "type": "boolean",
+            "description": "Search subdirectories too",
+            "default": True,
+        },
+        "regex": _REGEX_PROP,
+        "max_results": _MAX_RESULTS_PROP,
+        "max_workers": _MAX_WORKERS_PROP,
+    },
+    "required": ["directory_path", "pattern"],
+}
+_SEARCH_FILES_SCHEMA = MappingProxyType(_SEARCH_FILES_QUERY)
+
+_FIND_TEXT_QUERY = {
+    "type": "object",
+    "properties": {
+        "directory_path": _DIRECTORY_PATH_PROP,
+        "search_text": {
+            "type": "string",
+            "description": "Text to look for",
+        },
+        "file_pattern": {
+            "type": "string",
+            "description": "Only scan files matching this pattern",
+            "default": "*",
+        },
+        "case_sensitive": {
+            "type": "boolean",
+            "description": "Match case exactly",
+            "default": False,
+        },
+        "engine": _ENGINE_PROP,
+        "regex": _REGEX_PROP,
+        "max_results": _MAX_RESULTS_PROP,
+        "max_workers": _MAX_WORKERS_PROP,
+        "return_mode": _RETURN_MODE_PROP,
+        "max_inline_bytes": _MAX_INLINE_BYTES_PROP,
+    },
+    "required": ["directory_path", "search_text"],
+}
+_FIND_TEXT_SCHEMA = MappingProxyType(_FIND_TEXT_QUERY)
+
+_FILE_PATHS_PROP = {
+    "type": "array",
+    "items": {"type": "string"},
+    "description": "Paths to process in one call",
+}
+
+_READ_BATCH_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "file_paths": _FILE_PATHS_PROP,
+    },
+    "required": ["file_paths"],
+})
+
+_FILE_INFO_BATCH_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "file_paths": _FILE_PATHS_PROP,
+    },
+    "required": ["file_paths"],
+})
+
+_SEARCH_FILES_BATCH_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "queries": {
+            "type": "array",
+            "items": _SEARCH_FILES_QUERY,
+            "description": "search_files argument sets to run concurrently",
+        },
+    },
+    "required": ["queries"],
+})
+
+_FIND_TEXT_BATCH_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "queries": {
+            "type": "array",
+            "items": _FIND_TEXT_QUERY,
+            "description": "find_text argument sets to run concurrently",
+        },
+    },
+    "required": ["queries"],
+})
+
+_FILE_INFO_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "file_path": _FILE_PATH_PROP,
+    },
+    "required": ["file_path"],
+})
+
+_CONFIGURE_ODOO_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "url": {
+            "type": "string",
+            "description": "Base URL of the Odoo server",
+        },
+        "db": {
+            "type": "string",
+            "description": "Database name",
+        },
+        "username": {
+            "type": "string",
+            "description": "Login user",
+        },
+        "password": {
+            "type": "string",
+            "description": "Password or API key",
+        },
+    },
+    "required": ["url", "db", "username", "password"],
+})
+
+_GET_CONTACT_INFO_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "prompt": {
+            "type": "string",
+            "description": "Request text containing the VAT number",
+        },
+    },
+    "required": ["prompt"],
+})
+
+_DISCOVER_TOOLS_SCHEMA = MappingProxyType({"type": "object", "properties": {}})
+
+# _meta hints for clients that manage prompt caches: read-only results
+# should not earn cache writes, and search results change between calls.
+_NO_CACHE_META = {"cache_hint": "no-cache"}
+_EPHEMERAL_META = {"cache_hint": "ephemeral"}
+
+# Registration rows live as slots-based namedtuples, far lighter than a
+# Pydantic model per tool; the schemas are authored above and trusted,
+# so the builders skip validation entirely. Mutating tools carry no meta
+# so their effects still invalidate caches predictably.
+ToolSpec = namedtuple("ToolSpec", "name description input_schema meta", defaults=(None,))
+
+_CORE_TOOL_TABLE = (
+    ToolSpec(
+        "read_file",
+        "Read the contents of a text or .docx file",
+        _READ_FILE_SCHEMA,
+        _NO_CACHE_META,
+    ),
+    ToolSpec(
+        "write_file",
+        "Write content to a file, replacing anything already there",
+        _WRITE_FILE_SCHEMA,
+    ),
+    ToolSpec(
+        "list_directory",
+        "List the contents of a directory",
+        _LIST_DIRECTORY_SCHEMA,
+        _NO_CACHE_META,
+    ),
+    ToolSpec("configure_odoo", "Connect to an Odoo instance", _CONFIGURE_ODOO_SCHEMA),
+    ToolSpec(
+        "get_contact_info",
+        "Look up an Odoo partner's contact details by VAT number",
+        _GET_CONTACT_INFO_SCHEMA,
+        _NO_CACHE_META,
+    ),
+)
+
+_EXTENDED_TOOL_TABLE = (
+    ToolSpec("append_file", "Append content to the end of a file", _APPEND_FILE_SCHEMA),
+    ToolSpec(
+        "create_directory",
+        "Create a directory (including missing parents)",
+        _CREATE_DIRECTORY_SCHEMA,
+    ),
+    ToolSpec("delete_file", "Delete a file or directory", _DELETE_FILE_SCHEMA),
+    ToolSpec("move_file", "Move or rename a file or directory", _MOVE_FILE_SCHEMA),
+    ToolSpec("copy_file", "Copy a file or directory", _COPY_FILE_SCHEMA),
+    ToolSpec(
+        "search_files",
+        "Search for files matching a wildcard pattern",
+        _SEARCH_FILES_SCHEMA,
+        _EPHEMERAL_META,
+    ),
+    ToolSpec(
+        "find_text",
+        "Find a text string inside files",
+        _FIND_TEXT_SCHEMA,
+        _EPHEMERAL_META,
+    ),
+    ToolSpec(
+        "file_info",
+        "Get detailed information about a file or directory",
+        _FILE_INFO_SCHEMA,
+        _NO_CACHE_META,
+    ),
+    ToolSpec(
+        "list_directory_stat",
+        "List a directory with per-entry metadata from a single scan",
+        _LIST_DIRECTORY_STAT_SCHEMA,
+        _NO_CACHE_META,
+    ),
+    ToolSpec(
+        "read_batch",
+        "Read several files in one call",
+        _READ_BATCH_SCHEMA,
+        _NO_CACHE_META,
+    ),
+    ToolSpec(
+        "file_info_batch",
+        "Get detailed information about several paths in one call",
+        _FILE_INFO_BATCH_SCHEMA,
+        _NO_CACHE_META,
+    ),
+    ToolSpec(
+        "search_files_batch",
+        "Run several file searches in one call",
+        _SEARCH_FILES_BATCH_SCHEMA,
+        _EPHEMERAL_META,
+    ),
+    ToolSpec(
+        "find_text_batch",
+        "Run several text searches in one call",
+        _FIND_TEXT_BATCH_SCHEMA,
+        _EPHEMERAL_META,
+    ),
+)
+
+_DISCOVER_TOOL_ROW = ToolSpec(
+    "discover_tools",
+    "Enable the extended filesystem tools for this server",
+    _DISCOVER_TOOLS_SCHEMA,
+)
+
+
+def get_tool_specs() -> tuple[ToolSpec, ...]:
+    """Return every registration row, for callers that only need
+    ``.name``/``.input_schema`` and not a full Tool model."""
+    return _CORE_TOOL_TABLE + _EXTENDED_TOOL_TABLE + (_DISCOVER_TOOL_ROW,)
+
+
+@functools.lru_cache(maxsize=1)
+def _tool_cls():
+    """Import mcp.types on first use and return the Tool class.
+
+    The import pulls in Pydantic and the whole MCP type hierarchy —
+    easily the most expensive import in this module — so consumers that
+    never ask for tool definitions (health checks, schema-cache builds
+    from the persisted blob) skip it entirely.
+    """
+    import mcp.types as types
+
+    return types.Tool
+
+
+def _build_tools(table) -> list[types.Tool]:
+    tool_cls = _tool_cls()
+    return [
+        tool_cls.model_construct(
+            name=spec.name,
+            description=spec.description,
+            inputSchema=spec.input_schema,
+            meta=spec.meta,
+        )
+        for spec in table
+    ]
+
+
+def _schema_to_json(schema) -> bytes:
+    # JSON encoders want a real dict; the proxies are shallow, so one
+    # dict() copy at cache-fill time is enough.
+    if isinstance(schema, MappingProxyType):
+        schema = dict(schema)
+    if orjson is not None:
+        return orjson.dumps(schema)
+    return json.dumps(schema, separators=(",", ":")).encode("utf-8")
+
+
+def get_schema_json(name: str) -> bytes | None:
+    """Return the pre-serialized inputSchema for ``name``, if known.
+
+    The stdio server itself cannot use these bytes: the MCP SDK
+    serializes whole responses through Pydantic and offers no seam to
+    splice pre-encoded fragments. The cache exists for out-of-band
+    consumers (HTTP gateways, docs generators, the schema-cache build)
+    that emit schemas verbatim and would otherwise re-walk the dicts.
+    """
+    if not _SCHEMA_JSON_CACHE:
+        for spec in get_tool_specs():
+            _SCHEMA_JSON_CACHE[spec.name] = _schema_to_json(spec.input_schema)
+    return _SCHEMA_JSON_CACHE.get(name)
+
+
+@functools.lru_cache(maxsize=None)
+def get_validator(name: str):
+    """Return a compiled argument validator for tool ``name``, or None.
+
+    With fastjsonschema available each inputSchema is compiled to a
+    specialized function once, so per-call validation skips the generic
+    schema walker; without it (or for unknown tools) callers fall back
+    to whatever validation the framework does.
+    """
+    if fastjsonschema is None:
+        return None
+    for spec in get_tool_specs():
+        if spec.name == name:
+            return fastjsonschema.compile(dict(spec.input_schema))
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def get_core_tools() -> list[types.Tool]:
+    """Return the always-advertised tools.
+
+    Built once and memoized: the definitions never change at runtime,
+    and rebuilding them re-runs every schema dict construction plus
+    Pydantic validation on each ``tools/list``.
+    """
+    return _build_tools(_CORE_TOOL_TABLE)
+
+
+@functools.lru_cache(maxsize=1)
+def get_extended_tools() -> list[types.Tool]:
+    """Return the tools deferred behind ``discover_tools`` in lazy mode."""
+    return _build_tools(_EXTENDED_TOOL_TABLE)
+
+
+@functools.lru_cache(maxsize=1)
+def _discover_tool() -> types.Tool:
+    return _build_tools((_DISCOVER_TOOL_ROW,))[0]
+
+
+def enable_extended_tools() -> bool:
+    """Enable the extended set; returns True if it was newly enabled."""
+    global _extended_enabled
+    if _extended_enabled:
+        return False
+    _extended_enabled = True
+    return True
+
+
+# Written by _build_schema_cache.py at build time; absent in dev trees.
+_CACHE_FILE = "tool_definitions.cache.json"
+
+
+def _load_cached_tools() -> list[types.Tool] | None:
+    """Reconstruct the full Tool list from the persisted cache blob.
+
+    Cold starts then pay one json.loads and a model_construct per row
+    instead of building every schema dict in this module. Any problem
+    with the blob falls back to the in-code tables.
+    """
+    try:
+        raw = (
+            importlib.resources.files(__package__)
+            .joinpath(_CACHE_FILE)
+            .read_bytes()
+        )
+    except (FileNotFoundError, ModuleNotFoundError, OSError):
+        return None
+    try:
+        if orjson is not None:
+            rows = orjson.loads(raw)
+        else:
+            rows = json.loads(raw)
+        tool_cls = _tool_cls()
+        return [tool_cls.model_construct(**row) for row in rows]
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _all_tools() -> list[types.Tool]:
+    cached = _load_cached_tools()
+    if cached is not None:
+        return cached
+    return [*get_core_tools(), *get_extended_tools()]
+
+
+@functools.lru_cache(maxsize=1)
+def _lazy_tools() -> list[types.Tool]:
+    return [*get_core_tools(), _discover_tool()]
+
+
+def get_all_tools() -> list[types.Tool]:
+    """Return the Tool definitions currently advertised by the server.
+
+    With ``ODOO_MCP_LAZY=1`` only the core set plus ``discover_tools``
+    is advertised until a client calls ``discover_tools``, which keeps
+    the schema payload (and the client's prompt tokens) small for
+    sessions that never touch the extended tools.
+    """
+    if os.environ.get("ODOO_MCP_LAZY") == "1" and not _extended_enabled:
+        return _lazy_tools()
+    return _all_tools()